@@ -7,6 +7,7 @@ Windows-compatible version with proper encoding handling
 
 import os
 import sys
+import gzip
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import argparse
@@ -20,10 +21,25 @@ def safe_print(text):
         # Fallback for Windows Command Prompt
         print(text.encode('ascii', 'replace').decode('ascii'))
 
+def open_trx_file(trx_file):
+    """Open a TRX file for streaming reads, decompressing .trx.gz / .trx.zst on the fly"""
+    if trx_file.endswith('.gz'):
+        return gzip.open(trx_file, 'rb')
+    if trx_file.endswith('.zst'):
+        try:
+            import zstandard
+        except ImportError:
+            safe_print("ERROR: Reading .zst TRX files requires the 'zstandard' package (pip install zstandard)")
+            sys.exit(1)
+        return zstandard.ZstdDecompressor().stream_reader(open(trx_file, 'rb'), closefd=True)
+    return open(trx_file, 'rb')
+
 def parse_trx_file(trx_file):
     """Parse TRX file and extract test results with actual results and failure reasons"""
     try:
-        tree = ET.parse(trx_file)
+        # ET.parse feeds the parser chunk by chunk, so compressed TRX is never inflated in full on disk
+        with open_trx_file(trx_file) as trx_stream:
+            tree = ET.parse(trx_stream)
         root = tree.getroot()
         
         # Extract test results
@@ -290,7 +306,7 @@ def parse_trx_file(trx_file):
         safe_print(f"ERROR: Error parsing TRX file: {e}")
         sys.exit(1)
 
-def generate_html_report(data, output_path):
+def generate_html_report(data, output_path, gzip_copy=False):
     """Generate HTML report with actual results and failure reasons"""
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
@@ -421,6 +437,11 @@ def generate_html_report(data, output_path):
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         safe_print(f"SUCCESS: HTML report generated: {output_path}")
+        if gzip_copy:
+            # Precompressed copy for artifact upload / static hosting (Content-Encoding: gzip)
+            with gzip.open(output_path + '.gz', 'wt', encoding='utf-8', compresslevel=9) as f:
+                f.write(html_content)
+            safe_print(f"SUCCESS: Precompressed HTML report generated: {output_path}.gz")
         return True
     except Exception as e:
         safe_print(f"ERROR: Error writing HTML file: {e}")
@@ -428,8 +449,9 @@ def generate_html_report(data, output_path):
 
 def main():
     parser = argparse.ArgumentParser(description='Generate enhanced HTML test report with actual results - Windows Compatible')
-    parser.add_argument('--trx', default='TestResults/TestResults_2025-10-24_09-56-03.trx', help='TRX file path')
+    parser.add_argument('--trx', default='TestResults/TestResults_2025-10-24_09-56-03.trx', help='TRX file path (.trx, .trx.gz or .trx.zst)')
     parser.add_argument('--output', default='TestReports', help='Output directory')
+    parser.add_argument('--gzip-html', action='store_true', help='Also write a gzip-precompressed copy of the HTML report')
     
     args = parser.parse_args()
     
@@ -458,7 +480,7 @@ def main():
     safe_print(f"   Success Rate: {data['success_rate']}%")
     
     # Generate HTML report
-    if generate_html_report(data, html_report_path):
+    if generate_html_report(data, html_report_path, gzip_copy=args.gzip_html):
         safe_print("SUCCESS: Enhanced HTML report with actual results generation completed!")
     else:
         sys.exit(1)
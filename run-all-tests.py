@@ -8,22 +8,137 @@ Runs the SpecFlow test project, generates a LivingDoc report, and opens it (opti
 from __future__ import annotations
 
 import argparse
+import contextlib
+import gzip
+import hashlib
+import json
 import os
+import posixpath
+import re
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
+from typing import BinaryIO
 
 ROOT = Path(__file__).resolve().parent
 SPECFLOW_PROJECT = ROOT / "SpecFlowTests" / "SpecFlowTests.csproj"
+TEST_RESULTS_DIR = ROOT / "SpecFlowTests" / "TestResults"
 
+# Suffix appended to artifacts for each --compress-artifacts codec.
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+STREAM_CHUNK_SIZE = 1024 * 1024
 
-def run_command(cmd: list[str], *, env: dict[str, str] | None = None, cwd: Path | None = None) -> None:
-    """Execute a command and stop on failure."""
+
+def run_command(
+    cmd: list[str],
+    *,
+    env: dict[str, str] | None = None,
+    cwd: Path | None = None,
+    stdin: BinaryIO | None = None,
+) -> None:
+    """Execute a command and stop on failure, optionally streaming ``stdin`` into it."""
     print(f"\n> {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=cwd or ROOT, env=env)
-    if result.returncode != 0:
-        raise RuntimeError(f"Command failed with exit code {result.returncode}: {' '.join(cmd)}")
+    if stdin is None:
+        returncode = subprocess.run(cmd, cwd=cwd or ROOT, env=env).returncode
+    else:
+        proc = subprocess.Popen(cmd, cwd=cwd or ROOT, env=env, stdin=subprocess.PIPE)
+        assert proc.stdin is not None
+        try:
+            shutil.copyfileobj(stdin, proc.stdin, STREAM_CHUNK_SIZE)
+        except BrokenPipeError:
+            pass  # the child exited early; its return code tells the story
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"Command failed with exit code {returncode}: {' '.join(cmd)}")
+
+
+def _import_zstandard():
+    """Import the optional ``zstandard`` package with an actionable error."""
+    try:
+        import zstandard
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise RuntimeError("zstd support requires the 'zstandard' package (pip install zstandard)") from exc
+    return zstandard
+
+
+def open_artifact(path: Path) -> BinaryIO:
+    """Open ``path`` for streaming reads, decompressing ``.gz``/``.zst`` on the fly."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if path.suffix == ".zst":
+        return _import_zstandard().ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
+    return path.open("rb")
+
+
+def compress_artifact(path: Path, codec: str, *, keep_original: bool) -> Path:
+    """Stream ``path`` into a compressed sibling file and return its location.
+
+    A partially written target is removed if compression fails.
+    """
+    target = path.with_name(path.name + COMPRESSION_SUFFIXES[codec])
+    try:
+        with path.open("rb") as src:
+            if codec == "gzip":
+                with gzip.open(target, "wb", compresslevel=9) as dst:
+                    shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+            else:
+                cctx = _import_zstandard().ZstdCompressor(level=19)
+                with target.open("wb") as raw, cctx.stream_writer(raw, closefd=False) as dst:
+                    shutil.copyfileobj(src, dst, STREAM_CHUNK_SIZE)
+    except BaseException:
+        target.unlink(missing_ok=True)
+        raise
+    # Drop copies in other codecs so a later run cannot mistake them for current results.
+    for suffix in COMPRESSION_SUFFIXES.values():
+        sibling = path.with_name(path.name + suffix)
+        if sibling != target:
+            sibling.unlink(missing_ok=True)
+    if not keep_original:
+        path.unlink()
+    return target
+
+
+def fresh_trx_files(run_started: float) -> list[Path]:
+    """Return the TRX files ``dotnet test`` wrote since ``run_started`` (a ``time.time()`` value).
+
+    The default ``--logger trx`` names files ``<user>_<host>_<date>.trx``, so match any name.
+    """
+    if not TEST_RESULTS_DIR.is_dir():
+        return []
+    return sorted(path for path in TEST_RESULTS_DIR.glob("*.trx") if path.stat().st_mtime >= run_started)
+
+
+def generate_trx_summary(trx_file: Path, output_html: Path, env: dict[str, str]) -> bool:
+    """Render ``trx_file`` (plain, .gz or .zst) to HTML with tools/TrxReportGenerator."""
+    # The generator reads plain and .gz TRX itself; other codecs are streamed through stdin.
+    streamed = trx_file.suffix not in (".trx", ".gz")
+    try:
+        with open_artifact(trx_file) if streamed else contextlib.nullcontext() as trx_stream:
+            run_command(
+                [
+                    "dotnet",
+                    "run",
+                    "--project",
+                    str(ROOT / "tools" / "TrxReportGenerator" / "TrxReportGenerator.csproj"),
+                    "--",
+                    "-" if streamed else str(trx_file),
+                    str(output_html),
+                ],
+                env=env,
+                stdin=trx_stream,
+            )
+    except (OSError, RuntimeError) as exc:
+        print(f"\n⚠️  TRX summary generation failed: {exc}")
+        return False
+    print(f"✅ TRX summary report generated at {output_html}")
+    return True
 
 
 def ensure_livingdoc(env: dict[str, str]) -> str | None:
@@ -46,6 +161,397 @@ def ensure_livingdoc(env: dict[str, str]) -> str | None:
     return None
 
 
+# --- Change-impact test selection -------------------------------------------------
+
+FEATURES_DIR = ROOT / "SpecFlowTests" / "Features"
+IMPACT_CACHE = ROOT / ".test-impact-cache.json"
+IMPACT_CACHE_VERSION = 3
+
+# Changes to these paths (prefix match, relative to ROOT) affect every scenario.
+FULL_SUITE_TRIGGERS = (
+    "SpecFlowTests/SpecFlowTests.csproj",
+    "SpecFlowTests/Hooks/",
+    "Services/HttpClientService.cs",
+    "Services/RetryService.cs",
+    "Services/TestUtilities.cs",
+    "appsettings",
+)
+PROJECT_OUTPUT_DIRS = {"bin", "obj", "TestResults"}
+
+STEP_KEYWORDS = ("Given", "When", "Then", "And", "But", "*")
+# Matches every binding in an attribute list, e.g. both entries of [Given(@"x"), When(@"x")].
+STEP_ATTRIBUTE_RE = re.compile(r'[\[,]\s*(Given|When|Then|StepDefinition)\s*\(\s*(@?)"((?:[^"\\]|""|\\.)*)"')
+CSHARP_ESCAPE_RE = re.compile(r"\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|x[0-9A-Fa-f]{1,4}|.)")
+CSHARP_SIMPLE_ESCAPES = {"0": "\0", "a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+TYPE_DECLARATION_RE = re.compile(r"\b(?:class|record|struct|interface|enum)\s+([A-Z]\w*)")
+IDENTIFIER_RE = re.compile(r"\b[A-Z]\w*\b")
+# Hooks and argument transformations apply to every scenario, wherever their [Binding] class lives.
+GLOBAL_BINDING_RE = re.compile(
+    r"[\[,]\s*(?:(?:Before|After)(?:TestRun|Feature|Scenario|ScenarioBlock|Step)|StepArgumentTransformation)"
+    r"(?:Attribute)?\b"
+)
+PROJECT_INCLUDE_RE = re.compile(r'<(?:Compile|None)\s+Include="([^"]+)"')
+
+
+def _relative(path: Path) -> str:
+    return path.relative_to(ROOT).as_posix()
+
+
+def project_include_patterns() -> list[str]:
+    """Return the csproj Compile/None include globs relative to ROOT, e.g. ``Models/**/*.cs``."""
+    project_dir = _relative(SPECFLOW_PROJECT.parent)
+    return [
+        posixpath.normpath(posixpath.join(project_dir, include.replace("\\", "/")))
+        for include in PROJECT_INCLUDE_RE.findall(SPECFLOW_PROJECT.read_text(encoding="utf-8"))
+    ]
+
+
+def _matches_include(rel: str, pattern: str) -> bool:
+    """Match ``rel`` against an MSBuild-style glob, whether or not the file still exists."""
+    regex = "".join(
+        "(?:.*/)?" if part == "**/" else "[^/]*" if part == "*" else re.escape(part)
+        for part in re.split(r"(\*\*/|\*)", pattern)
+    )
+    return re.fullmatch(regex, rel) is not None
+
+
+def is_project_path(rel: str) -> bool:
+    """Return True when ``rel`` is (or was, if deleted) an input of the SpecFlow project."""
+    if rel.startswith("SpecFlowTests/"):
+        return not PROJECT_OUTPUT_DIRS.intersection(Path(rel).parts)
+    return any(_matches_include(rel, pattern) for pattern in project_include_patterns())
+
+
+def project_files() -> list[str]:
+    """Return every source/config file the SpecFlow project builds from, relative to ROOT."""
+    project_dir = SPECFLOW_PROJECT.parent
+    files = {
+        _relative(path)
+        for path in project_dir.rglob("*")
+        if path.is_file()
+        and not PROJECT_OUTPUT_DIRS.intersection(path.relative_to(project_dir).parts)
+        and not path.name.endswith(".feature.cs")
+    }
+    # Files linked into the project from the repository root (Models, shared Services, appsettings).
+    for pattern in project_include_patterns():
+        for path in ROOT.glob(pattern):
+            if path.is_file():
+                files.add(_relative(path))
+    return sorted(files)
+
+
+def feature_class_name(title: str) -> str:
+    """Mirror SpecFlow's generated fixture name: 'Patients clinic API' -> 'PatientsClinicAPIFeature'."""
+    words = re.split(r"[^0-9A-Za-z_]+", re.sub(r"[\n.\-]+", "_", title))
+    identifier = "".join(word[:1].upper() + word[1:] for word in words)
+    if identifier[:1].isdigit():
+        identifier = f"_{identifier}"
+    return f"{identifier}Feature"
+
+
+def parse_feature(path: Path) -> tuple[str, list[tuple[str, str]]]:
+    """Return the feature title and its (keyword, text) steps, with Scenario Outlines expanded."""
+    title = path.stem
+    steps: list[tuple[str, str]] = []
+    outline: list[tuple[str, str]] | None = None
+    headers: list[str] | None = None
+    in_examples = in_docstring = False
+    last_keyword = "Given"
+
+    for raw_line in path.read_text(encoding="utf-8-sig").splitlines():
+        line = raw_line.strip()
+        if line.startswith('"""') or line.startswith("```"):
+            in_docstring = not in_docstring
+            continue
+        if in_docstring or not line or line.startswith("#") or line.startswith("@"):
+            continue
+        if line.startswith("Feature:"):
+            title = line.partition(":")[2].strip()
+        elif line.startswith(("Scenario Outline:", "Scenario Template:")):
+            outline, headers, in_examples = [], None, False
+        elif line.startswith(("Scenario:", "Background:", "Rule:", "Example:")):
+            outline, headers, in_examples = None, None, False
+        elif line.startswith(("Examples:", "Scenarios:")):
+            in_examples, headers = True, None
+        elif line.startswith("|"):
+            if not (in_examples and outline is not None):
+                continue  # step data table
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if headers is None:
+                headers = cells
+                continue
+            row = dict(zip(headers, cells))
+            for keyword, text in outline:
+                steps.append((keyword, re.sub(r"<([^<>]+)>", lambda m: row.get(m.group(1), m.group(0)), text)))
+        else:
+            keyword, _, text = line.partition(" ")
+            if keyword not in STEP_KEYWORDS:
+                continue
+            if keyword in ("Given", "When", "Then"):
+                last_keyword = keyword
+            step = (last_keyword, text.strip())
+            (outline if outline is not None else steps).append(step)
+
+    return title, steps
+
+
+def _unescape_csharp(literal: str) -> str:
+    """Decode the escape sequences of a regular (non-verbatim) C# string literal."""
+
+    def replace(match: re.Match[str]) -> str:
+        escape = match.group(1)
+        if escape[0] in "uUx" and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        return CSHARP_SIMPLE_ESCAPES.get(escape, escape)
+
+    return CSHARP_ESCAPE_RE.sub(replace, literal)
+
+
+def parse_step_bindings(source: str) -> list[tuple[str, re.Pattern[str] | None]]:
+    """Return (keyword, compiled regex) for each step attribute; None marks a regex Python cannot compile."""
+    bindings: list[tuple[str, re.Pattern[str] | None]] = []
+    for keyword, verbatim, literal in STEP_ATTRIBUTE_RE.findall(source):
+        pattern = literal.replace('""', '"') if verbatim else _unescape_csharp(literal)
+        try:
+            bindings.append((keyword, re.compile(pattern)))
+        except re.error:
+            bindings.append((keyword, None))
+    return bindings
+
+
+def _binding_matches(binding: tuple[str, re.Pattern[str] | None], keyword: str, text: str) -> bool:
+    binding_keyword, regex = binding
+    if binding_keyword not in (keyword, "StepDefinition"):
+        return False
+    # Be conservative with patterns that only .NET understands.
+    return regex is None or regex.fullmatch(text) is not None
+
+
+def _literal_end(source: str, start: int) -> int:
+    """Return the index just past the C# char or string literal opening at ``start``."""
+    n = len(source)
+    if source[start] == "'":
+        i = start + 1
+        while i < n and source[i] not in "'\n":
+            i += 2 if source[i] == "\\" else 1
+        return min(i + 1, n)
+
+    # Raw string literals: three or more quotes, closed by the same run.
+    quotes = len(source[start:]) - len(source[start:].lstrip('"'))
+    if quotes >= 3:
+        end = source.find('"' * quotes, start + quotes)
+        return n if end == -1 else end + quotes
+
+    prefix_start = start
+    while prefix_start > 0 and start - prefix_start < 2 and source[prefix_start - 1] in "@$":
+        prefix_start -= 1
+    prefix = source[prefix_start:start]
+    verbatim, interpolated = "@" in prefix, "$" in prefix
+
+    i = start + 1
+    while i < n:
+        ch = source[i]
+        if interpolated and ch == "{":
+            if source.startswith("{{", i):
+                i += 2
+            else:
+                i = _skip_code(source, i + 1, None, in_hole=True)
+        elif ch == "\\" and not verbatim:
+            i += 2
+        elif ch == '"':
+            if verbatim and source.startswith('""', i):
+                i += 2
+            else:
+                return i + 1
+        elif ch == "\n" and not verbatim:
+            return i
+        else:
+            i += 1
+    return n
+
+
+def _skip_code(source: str, i: int, out: list[str] | None, *, in_hole: bool = False) -> int:
+    """Scan code from ``i``, copying it minus comments into ``out``; stop after an interpolation hole's ``}``."""
+    n = len(source)
+    depth = 0
+    while i < n:
+        ch = source[i]
+        if source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        if source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            if out is not None:
+                out.append(" ")
+            continue
+        if ch in "\"'":
+            end = _literal_end(source, i)
+            if out is not None:
+                out.append(source[i:end])
+            i = end
+            continue
+        if in_hole and ch in "{}":
+            if ch == "}" and depth == 0:
+                return i + 1
+            depth += 1 if ch == "{" else -1
+        if out is not None:
+            out.append(ch)
+        i += 1
+    return n
+
+
+def strip_comments(source: str) -> str:
+    """Remove C# comments while leaving regular, verbatim, interpolated and raw string literals intact."""
+    out: list[str] = []
+    _skip_code(source, 0, out)
+    return "".join(out)
+
+
+def build_impact_map(files: list[str]) -> tuple[dict[str, dict[str, object]], list[str]]:
+    """Statically map each feature file to the project files its scenarios depend on.
+
+    Also returns the files declaring hooks or step argument transformations, which affect every feature.
+    """
+    sources = {
+        rel: strip_comments((ROOT / rel).read_text(encoding="utf-8-sig"))
+        for rel in files
+        if rel.endswith(".cs")
+    }
+    global_files = sorted(rel for rel, source in sources.items() if GLOBAL_BINDING_RE.search(source))
+
+    declared_in: dict[str, set[str]] = {}
+    for rel, source in sources.items():
+        for type_name in TYPE_DECLARATION_RE.findall(source):
+            declared_in.setdefault(type_name, set()).add(rel)
+
+    references: dict[str, set[str]] = {}
+    for rel, source in sources.items():
+        used = set(IDENTIFIER_RE.findall(source))
+        references[rel] = {dep for name in used for dep in declared_in.get(name, ()) if dep != rel}
+
+    bindings = {
+        rel: parse_step_bindings(source)
+        for rel, source in sources.items()
+        if rel.startswith("SpecFlowTests/Steps/")
+    }
+
+    impact: dict[str, dict[str, object]] = {}
+    for rel in files:
+        if not rel.endswith(".feature"):
+            continue
+        title, steps = parse_feature(ROOT / rel)
+        pending = [
+            step_file
+            for step_file, file_bindings in bindings.items()
+            if any(_binding_matches(b, keyword, text) for b in file_bindings for keyword, text in steps)
+        ]
+        depends_on = {rel}
+        while pending:
+            current = pending.pop()
+            if current in depends_on:
+                continue
+            depends_on.add(current)
+            pending.extend(references.get(current, ()))
+        impact[rel] = {"class": feature_class_name(title), "depends_on": sorted(depends_on)}
+    return impact, global_files
+
+
+def load_impact_map() -> tuple[list[str], dict[str, dict[str, object]], list[str]]:
+    """Return the project files, feature dependency map and global binding files.
+
+    The on-disk cache is reused when the project inputs are unchanged.
+    """
+    files = project_files()
+    fingerprint = hashlib.sha256()
+    for rel in files:
+        stat = (ROOT / rel).stat()
+        fingerprint.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    digest = fingerprint.hexdigest()
+
+    try:
+        cached = json.loads(IMPACT_CACHE.read_text(encoding="utf-8"))
+        if cached.get("version") == IMPACT_CACHE_VERSION and cached.get("fingerprint") == digest:
+            return files, cached["features"], cached["global"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    impact, global_files = build_impact_map(files)
+    cache = {"version": IMPACT_CACHE_VERSION, "fingerprint": digest, "features": impact, "global": global_files}
+    try:
+        IMPACT_CACHE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    except OSError as exc:
+        print(f"⚠️  Could not write dependency cache {IMPACT_CACHE}: {exc}")
+    return files, impact, global_files
+
+
+def git_changed_files(ref: str) -> list[str]:
+    """Return files changed since the merge base with ``ref``, including uncommitted and untracked files."""
+
+    def git(*git_args: str) -> list[str]:
+        result = subprocess.run(["git", *git_args], cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"git {' '.join(git_args)} failed: {result.stderr.strip()}")
+        return [line for line in result.stdout.splitlines() if line]
+
+    merge_base = git("merge-base", ref, "HEAD")[0]
+    changed = set(git("diff", "--name-only", merge_base))
+    changed.update(git("ls-files", "--others", "--exclude-standard"))
+    return sorted(changed)
+
+
+def select_features(ref: str) -> list[str] | None:
+    """Return the fixture class names affected since ``ref``, or None when the full suite must run."""
+    changed = git_changed_files(ref)
+    _, impact, global_files = load_impact_map()
+
+    selected: set[str] = set()
+    for rel in changed:
+        if rel.startswith(FULL_SUITE_TRIGGERS):
+            print(f"ℹ️  {rel} is shared by every scenario; running the full suite.")
+            return None
+        if rel in global_files:
+            print(f"ℹ️  {rel} declares hooks or step argument transformations; running the full suite.")
+            return None
+        affected = {info["class"] for info in impact.values() if rel in info["depends_on"]}  # type: ignore[operator]
+        # Deleted or renamed project files are no longer in the map, so they land here too.
+        if not affected and is_project_path(rel):
+            print(f"ℹ️  {rel} is not mapped to any feature; running the full suite.")
+            return None
+        selected.update(affected)  # type: ignore[arg-type]
+
+    return sorted(selected)
+
+
+def feature_filter(class_names: list[str]) -> str:
+    """Build a ``dotnet test --filter`` expression selecting the given generated fixtures."""
+    return "|".join(f"FullyQualifiedName~SpecFlowTests.Features.{name}" for name in class_names)
+
+
+def compress_results(trx_files: list[Path] | None, reports: list[Path], codec: str) -> None:
+    """Compress the TRX files in place and write gzip-precompressed copies of the HTML reports.
+
+    ``trx_files`` is None when no tests ran. Each artifact is handled independently so one
+    failure does not skip the rest.
+    """
+    if trx_files == []:
+        print(f"\n⚠️  No TRX written by this run in {TEST_RESULTS_DIR}; nothing to compress.")
+    for trx_file in trx_files or []:
+        try:
+            print(f"✅ Compressed TRX written to {compress_artifact(trx_file, codec, keep_original=False)}")
+        except (OSError, RuntimeError) as exc:
+            print(f"\n⚠️  Compressing {trx_file.name} failed: {exc}")
+    # HTML stays uncompressed next to the .gz copy so --open-report and static hosting keep working.
+    for report in reports:
+        if not report.exists():
+            continue
+        try:
+            print(f"✅ Precompressed report written to {compress_artifact(report, 'gzip', keep_original=True)}")
+        except (OSError, RuntimeError) as exc:
+            print(f"\n⚠️  Compressing {report.name} failed: {exc}")
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run SpecFlow suite and generate LivingDoc report.")
     parser.add_argument("--base-url", default="https://vhapistg.vaxcare.com", help="API base URL for the tests.")
@@ -55,8 +561,34 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--no-report", action="store_true", help="Skip LivingDoc report generation.")
     parser.add_argument("--open-report", action="store_true", help="Open LivingDoc HTML after generation.")
     parser.add_argument("--logger", default="trx", help="Additional logger passed to dotnet test.")
+    parser.add_argument(
+        "--compress-artifacts",
+        choices=["none", *COMPRESSION_SUFFIXES],
+        default="none",
+        help="Replace this run's TRX files with compressed copies and gzip-precompress the HTML reports.",
+    )
+    parser.add_argument(
+        "--trx",
+        metavar="PATH",
+        type=Path,
+        default=None,
+        help="Skip dotnet test and only build TrxSummary.html from an existing .trx, .trx.gz or .trx.zst.",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        default=None,
+        help="Only run features affected by changes since GIT_REF (falls back to the full suite for shared code).",
+    )
     args = parser.parse_args(argv)
 
+    if args.compress_artifacts == "zstd":
+        try:
+            _import_zstandard()
+        except RuntimeError as exc:
+            print(f"❌ {exc}")
+            return 1
+
     if not SPECFLOW_PROJECT.exists():
         print(f"❌ SpecFlow project not found: {SPECFLOW_PROJECT}")
         return 1
@@ -66,25 +598,53 @@ def main(argv: list[str] | None = None) -> int:
     if args.environment:
         env["TEST_ENVIRONMENT"] = args.environment
 
+    trx_summary = TEST_RESULTS_DIR / "TrxSummary.html"
+
+    if args.trx is not None:
+        if not args.trx.exists():
+            print(f"❌ TRX file not found: {args.trx}")
+            return 1
+        if not generate_trx_summary(args.trx.resolve(), trx_summary, env):
+            return 1
+        if args.compress_artifacts != "none":
+            compress_results(None, [trx_summary], args.compress_artifacts)
+        return 0
+
     dotnet_test_cmd = ["dotnet", "test", str(SPECFLOW_PROJECT)]
     if args.logger:
         dotnet_test_cmd.extend(["--logger", args.logger])
 
+    if args.changed_since:
+        try:
+            affected = select_features(args.changed_since)
+        except RuntimeError as exc:
+            print(f"\n⚠️  Change-impact selection failed, running the full suite: {exc}")
+            affected = None
+        if affected is not None:
+            if not affected:
+                print(f"\n✅ No features affected by changes since {args.changed_since}; nothing to run.")
+                return 0
+            print(f"\nℹ️  Running {len(affected)} affected feature(s): {', '.join(affected)}")
+            dotnet_test_cmd.extend(["--filter", feature_filter(affected)])
+
+    run_started = time.time()
     try:
         run_command(dotnet_test_cmd, env=env)
     except RuntimeError as exc:
         print(f"\n❌ dotnet test failed: {exc}")
         return 1
 
-    custom_report = ROOT / "SpecFlowTests" / "TestResults" / "CustomReport.html"
+    custom_report = TEST_RESULTS_DIR / "CustomReport.html"
 
     if args.no_report:
         print("\nℹ️  Report generation skipped (--no-report).")
+        if args.compress_artifacts != "none":
+            compress_results(fresh_trx_files(run_started), [], args.compress_artifacts)
         return 0
 
     dll_path = ROOT / "SpecFlowTests" / "bin" / args.configuration / args.framework / "SpecFlowTests.dll"
     test_execution_json = dll_path.parent / "TestExecution.json"
-    output_html = ROOT / "SpecFlowTests" / "TestResults" / "LivingDoc.html"
+    output_html = TEST_RESULTS_DIR / "LivingDoc.html"
     output_html.parent.mkdir(parents=True, exist_ok=True)
 
     if not dll_path.exists():
@@ -137,41 +697,29 @@ def main(argv: list[str] | None = None) -> int:
         print(f"\n⚠️  Custom report generation failed: {exc}")
 
     # Generate TRX summary (works even if TestExecution.json missing)
-    trx_file = ROOT / "SpecFlowTests" / "TestResults" / "SpecFlow.trx"
+    trx_file = TEST_RESULTS_DIR / "SpecFlow.trx"
     if trx_file.exists():
-        try:
-            run_command(
-                [
-                    "dotnet",
-                    "run",
-                    "--project",
-                    str(ROOT / "tools" / "TrxReportGenerator" / "TrxReportGenerator.csproj"),
-                    "--",
-                    str(trx_file),
-                    str(ROOT / "SpecFlowTests" / "TestResults" / "TrxSummary.html"),
-                ],
-                env=env,
-            )
-            print(f"✅ TRX summary report generated at {ROOT / 'SpecFlowTests' / 'TestResults' / 'TrxSummary.html'}")
-        except RuntimeError as exc:
-            print(f"\n⚠️  TRX summary generation failed: {exc}")
+        generate_trx_summary(trx_file, trx_summary, env)
     else:
         print("⚠️  No SpecFlow.trx found; skipping TRX summary.")
 
+    if args.compress_artifacts != "none":
+        compress_results(
+            fresh_trx_files(run_started), [output_html, custom_report, trx_summary], args.compress_artifacts
+        )
+
     if args.open_report:
         try:
             if sys.platform.startswith("darwin"):
                 run_command(["open", str(output_html)])
                 if custom_report.exists():
                     run_command(["open", str(custom_report)])
-                trx_summary = ROOT / "SpecFlowTests" / "TestResults" / "TrxSummary.html"
                 if trx_summary.exists():
                     run_command(["open", str(trx_summary)])
             elif os.name == "nt":
                 os.startfile(str(output_html))  # type: ignore[arg-type]
                 if custom_report.exists():
                     os.startfile(str(custom_report))  # type: ignore[arg-type]
-                trx_summary = ROOT / "SpecFlowTests" / "TestResults" / "TrxSummary.html"
                 if trx_summary.exists():
                     os.startfile(str(trx_summary))  # type: ignore[arg-type]
             else:
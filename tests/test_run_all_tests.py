@@ -0,0 +1,263 @@
+"""Checks for artifact compression and change-impact selection in run-all-tests.py."""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_script(name: str, filename: str):
+    # The script file names are not valid module names, so load them by path.
+    spec = importlib.util.spec_from_file_location(name, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+runner = _load_script("run_all_tests", "run-all-tests.py")
+enhanced_report = _load_script("enhanced_report", "generate-enhanced-html-report-with-actual-results-windows.py")
+
+TRX_BYTES = b'<TestRun xmlns="http://microsoft.com/schemas/VisualStudio/TeamTest/2010">' + b"x" * 4096 + b"</TestRun>"
+
+
+def test_compress_artifact_gzip_round_trip(tmp_path):
+    trx = tmp_path / "SpecFlow.trx"
+    trx.write_bytes(TRX_BYTES)
+
+    target = runner.compress_artifact(trx, "gzip", keep_original=False)
+
+    assert target == tmp_path / "SpecFlow.trx.gz"
+    assert not trx.exists()
+    with runner.open_artifact(target) as stream:
+        assert stream.read() == TRX_BYTES
+
+
+def test_compress_artifact_zstd_round_trip(tmp_path):
+    pytest.importorskip("zstandard")
+    trx = tmp_path / "SpecFlow.trx"
+    trx.write_bytes(TRX_BYTES)
+
+    target = runner.compress_artifact(trx, "zstd", keep_original=True)
+
+    assert trx.exists()
+    with runner.open_artifact(target) as stream:
+        assert stream.read() == TRX_BYTES
+
+
+def test_compress_artifact_removes_partial_target_on_failure(tmp_path, monkeypatch):
+    trx = tmp_path / "SpecFlow.trx"
+    trx.write_bytes(TRX_BYTES)
+
+    def disk_full(*args):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(runner.shutil, "copyfileobj", disk_full)
+
+    with pytest.raises(OSError):
+        runner.compress_artifact(trx, "gzip", keep_original=False)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["SpecFlow.trx"]
+
+
+def test_compress_artifact_removes_other_codec_sibling(tmp_path):
+    trx = tmp_path / "SpecFlow.trx"
+    trx.write_bytes(TRX_BYTES)
+    (tmp_path / "SpecFlow.trx.zst").write_bytes(b"stale")
+
+    runner.compress_artifact(trx, "gzip", keep_original=False)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["SpecFlow.trx.gz"]
+
+
+def test_fresh_trx_files_skips_results_from_earlier_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "TEST_RESULTS_DIR", tmp_path)
+    run_started = time.time()
+    stale = tmp_path / "SpecFlow.trx"
+    stale.write_bytes(TRX_BYTES)
+    os.utime(stale, (run_started - 3600, run_started - 3600))
+    (tmp_path / "agent_host_2026-10-19_01_00_00.trx").write_bytes(TRX_BYTES)
+    (tmp_path / "old.trx.gz").write_bytes(b"")
+
+    assert [path.name for path in runner.fresh_trx_files(run_started)] == ["agent_host_2026-10-19_01_00_00.trx"]
+
+
+def test_compress_results_warns_when_run_wrote_no_trx(tmp_path, capsys):
+    report = tmp_path / "TrxSummary.html"
+    report.write_text("<html></html>", encoding="utf-8")
+
+    runner.compress_results([], [report], "gzip")
+
+    assert "nothing to compress" in capsys.readouterr().out
+    assert (tmp_path / "TrxSummary.html.gz").exists()
+    assert report.exists()
+
+
+def test_trx_option_reports_on_existing_gzip_artifact_without_running_tests(tmp_path, monkeypatch):
+    monkeypatch.setattr(runner, "TEST_RESULTS_DIR", tmp_path)
+    commands = []
+    monkeypatch.setattr(runner, "run_command", lambda cmd, **kwargs: commands.append((cmd, kwargs.get("stdin"))))
+    artifact = tmp_path / "SpecFlow.trx.gz"
+    artifact.write_bytes(gzip.compress(TRX_BYTES))
+
+    assert runner.main(["--trx", str(artifact)]) == 0
+    assert runner.main(["--trx", str(tmp_path / "missing.trx.gz")]) == 1
+
+    [(cmd, stdin)] = commands
+    assert "test" not in cmd
+    assert cmd[-2:] == [str(artifact), str(tmp_path / "TrxSummary.html")]
+    assert stdin is None
+
+
+def test_generate_html_report_writes_identical_gzip_copy(tmp_path):
+    data = {
+        "total_tests": 1,
+        "passed_tests": 1,
+        "failed_tests": 0,
+        "skipped_tests": 0,
+        "success_rate": 100.0,
+        "test_details": [],
+    }
+    output = tmp_path / "report.html"
+
+    assert enhanced_report.generate_html_report(data, str(output), gzip_copy=True)
+
+    with gzip.open(f"{output}.gz", "rt", encoding="utf-8") as compressed:
+        assert compressed.read() == output.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    ("feature", "expected"),
+    [
+        ("PatientsClinic.feature", "PatientsClinicAPIFeature"),
+        ("PatientsAppointmentCreate.feature", "PatientsAppointmentCreationFeature"),
+        ("SetupUsersPartnerLevel.feature", "SetupUsersPartnerLevelAPIFeature"),
+    ],
+)
+def test_feature_class_name_matches_real_titles(feature, expected):
+    title, _ = runner.parse_feature(runner.FEATURES_DIR / feature)
+    assert runner.feature_class_name(title) == expected
+
+
+def test_feature_class_name_turns_dashes_into_underscores():
+    assert runner.feature_class_name("Patients Clinic - API Smoke Tests") == "PatientsClinic_APISmokeTestsFeature"
+
+
+def test_parse_feature_expands_scenario_outline(tmp_path):
+    feature = tmp_path / "Outline.feature"
+    feature.write_text(
+        "Feature: Outline sample\n"
+        "  Scenario Outline: versions\n"
+        '    Given the version "<version>"\n'
+        "    And the date <date>\n"
+        "    Examples:\n"
+        "      | version | date       |\n"
+        "      | 2.0     | 2025-10-22 |\n"
+        "      | v2      | bad        |\n",
+        encoding="utf-8",
+    )
+
+    title, steps = runner.parse_feature(feature)
+
+    assert title == "Outline sample"
+    assert steps == [
+        ("Given", 'the version "2.0"'),
+        ("Given", "the date 2025-10-22"),
+        ("Given", 'the version "v2"'),
+        ("Given", "the date bad"),
+    ]
+
+
+def test_parse_step_bindings_handles_verbatim_quotes_and_attribute_lists():
+    source = '[Given(@"a ""([^""]+)"" patient"), When("caf\\u00e9 \\\\d+ é")]'
+
+    bindings = runner.parse_step_bindings(source)
+
+    assert [keyword for keyword, _ in bindings] == ["Given", "When"]
+    assert bindings[0][1].fullmatch('a "RiskFree" patient')
+    assert bindings[1][1].pattern == "café \\d+ é"
+
+
+@pytest.fixture
+def changed(monkeypatch, tmp_path):
+    """Point the impact cache at tmp_path and return a setter for the git change list."""
+    monkeypatch.setattr(runner, "IMPACT_CACHE", tmp_path / "cache.json")
+
+    def set_changed(*paths: str) -> None:
+        monkeypatch.setattr(runner, "git_changed_files", lambda ref: list(paths))
+
+    return set_changed
+
+
+def test_select_features_narrows_to_dependent_feature(changed):
+    changed("SpecFlowTests/Drivers/AppointmentCheckoutDriver.cs", "README.md")
+    assert runner.select_features("HEAD") == ["PatientsAppointmentCheckoutFeature"]
+
+
+def test_select_features_runs_full_suite_for_deleted_linked_model(changed):
+    changed("Models/DeletedModel.cs")
+    assert runner.select_features("HEAD") is None
+
+
+def test_select_features_runs_full_suite_for_shared_service(changed):
+    changed("Services/HttpClientService.cs")
+    assert runner.select_features("HEAD") is None
+
+
+def test_select_features_ignores_files_outside_the_project(changed):
+    changed("README.md", "tools/TrxReportGenerator/Program.cs")
+    assert runner.select_features("HEAD") == []
+
+
+def test_strip_comments_keeps_comment_markers_inside_string_literals():
+    source = (
+        'var h = "Accept: */*"; // trailing comment\n'
+        'var v = @"C:\\dir\\"" /* not a comment */";\n'
+        'var i = $"{Build("/*")} done";\n'
+        "/* real\n   comment */\n"
+        '[Then(@"the page https://example.com/x loads")]\n'
+        '[Given(@"a patient")]\n'
+        "public void Step() => new AppointmentCheckoutDriver();\n"
+    )
+
+    stripped = runner.strip_comments(source)
+
+    assert "trailing comment" not in stripped
+    assert "real" not in stripped
+    assert '"Accept: */*"' in stripped
+    assert '/* not a comment */' in stripped
+    assert '$"{Build("/*")} done"' in stripped
+    assert "new AppointmentCheckoutDriver()" in stripped
+    assert [keyword for keyword, _ in runner.parse_step_bindings(stripped)] == ["Then", "Given"]
+    assert runner.parse_step_bindings(stripped)[0][1].fullmatch("the page https://example.com/x loads")
+
+
+def test_select_features_runs_full_suite_for_step_file_with_hooks(tmp_path, monkeypatch):
+    project = tmp_path / "SpecFlowTests"
+    (project / "Features").mkdir(parents=True)
+    (project / "Steps").mkdir()
+    (project / "SpecFlowTests.csproj").write_text("<Project />", encoding="utf-8")
+    (project / "Features" / "Sample.feature").write_text(
+        "Feature: Sample API\n  Scenario: s\n    Given a sample step\n", encoding="utf-8"
+    )
+    (project / "Steps" / "MixedSteps.cs").write_text(
+        "[Binding]\npublic sealed class MixedSteps\n{\n"
+        '    [Given(@"a sample step")]\n    public void Step() { }\n\n'
+        "    [BeforeScenario]\n    public void Reset() { }\n}\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(runner, "ROOT", tmp_path)
+    monkeypatch.setattr(runner, "SPECFLOW_PROJECT", project / "SpecFlowTests.csproj")
+    monkeypatch.setattr(runner, "IMPACT_CACHE", tmp_path / "cache.json")
+    monkeypatch.setattr(runner, "git_changed_files", lambda ref: ["SpecFlowTests/Steps/MixedSteps.cs"])
+
+    _, impact, global_files = runner.load_impact_map()
+
+    assert "SpecFlowTests/Steps/MixedSteps.cs" in impact["SpecFlowTests/Features/Sample.feature"]["depends_on"]
+    assert global_files == ["SpecFlowTests/Steps/MixedSteps.cs"]
+    assert runner.select_features("HEAD") is None
@@ -1,17 +1,20 @@
+using System.IO.Compression;
 using System.Xml.Linq;
 
 var argsList = args.ToList();
 
 if (argsList.Count < 2)
 {
-    Console.WriteLine("Usage: dotnet run --project tools/TrxReportGenerator -- <trx-file> <output-html>");
+    Console.WriteLine("Usage: dotnet run --project tools/TrxReportGenerator -- <trx-file|trx.gz-file|-> <output-html>");
     return 1;
 }
 
-var trxPath = Path.GetFullPath(argsList[0]);
+// "-" reads the TRX from stdin so callers can stream other codecs (e.g. zstd) through a decompressor.
+var readFromStdin = argsList[0] == "-";
+var trxPath = readFromStdin ? "-" : Path.GetFullPath(argsList[0]);
 var outputPath = Path.GetFullPath(argsList[1]);
 
-if (!File.Exists(trxPath))
+if (!readFromStdin && !File.Exists(trxPath))
 {
     Console.Error.WriteLine($"❌ TRX file not found: {trxPath}");
     return 1;
@@ -21,7 +24,12 @@ Console.WriteLine($"ℹ️  Parsing TRX: {trxPath}");
 
 try
 {
-    var doc = XDocument.Load(trxPath);
+    XDocument doc;
+    using (var input = OpenTrx(trxPath))
+    {
+        doc = XDocument.Load(input);
+    }
+
     var (summary, results) = ParseTrx(doc);
     var html = BuildHtml(summary, results);
 
@@ -37,6 +45,19 @@ catch (Exception ex)
     return 1;
 }
 
+static Stream OpenTrx(string path)
+{
+    if (path == "-")
+    {
+        return Console.OpenStandardInput();
+    }
+
+    var file = File.OpenRead(path);
+    return path.EndsWith(".gz", StringComparison.OrdinalIgnoreCase)
+        ? new GZipStream(file, CompressionMode.Decompress)
+        : file;
+}
+
 static (TrxSummary, List<TestResult>) ParseTrx(XDocument doc)
 {
     XNamespace ns = doc.Root?.Name.Namespace ?? XNamespace.None;